@@ -0,0 +1,71 @@
+# cython: language_level=3
+"""
+Compiled Text Cleaning (optional)
+=================================
+
+Cython build of clean_compile.clean_text(). clean_compile.py imports it
+automatically when the extension has been built and falls back to its
+pure-Python implementation otherwise.
+
+BUILD:
+    pip install cython
+    cythonize -i scripts/_clean.pyx
+
+NOTE:
+    The patterns come from _text_patterns.py, shared with clean_compile.py,
+    and the logic below is the same sequence of regex calls as clean_text()
+    there, so the two must stay in sync. There are no typed fast paths: the
+    speedup (about 20% on typical posts) comes only from compiling the
+    calls. Rebuild after changing either file; tests/clean-text-check.py
+    fails if a stale build disagrees with the Python version.
+"""
+
+import re
+
+from _text_patterns import (
+    BOLD_PATTERN, HTTP_URL_PATTERN, ITALIC_PATTERN, MARKUP_PATTERN,
+    MULTI_NEWLINE_PATTERN, NONSPACE, RE2_NONSPACE, SPACES_PATTERN,
+    STRIKE_PATTERN, WWW_URL_PATTERN
+)
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+cdef object _URL_RE = re.compile(HTTP_URL_PATTERN.format(nonspace=NONSPACE))
+cdef object _WWW_RE = re.compile(WWW_URL_PATTERN.format(nonspace=NONSPACE))
+cdef object _BOLD_RE = re.compile(BOLD_PATTERN)
+cdef object _ITAL_RE = re.compile(ITALIC_PATTERN)
+cdef object _STRIKE_RE = re.compile(STRIKE_PATTERN)
+cdef object _MULTI_NL_RE = re.compile(MULTI_NEWLINE_PATTERN)
+cdef object _WS_RE = re.compile(SPACES_PATTERN)
+# Linear-time RE2 pre-scan; texts without any URL/markup skip those passes
+cdef object _MARKUP_SCAN = re2.compile(
+    MARKUP_PATTERN.format(nonspace=RE2_NONSPACE)
+).search if re2 is not None else None
+
+
+cpdef str clean_text(object text):
+    """
+    Clean text content by removing URLs, excess whitespace, and unwanted characters.
+
+    Args:
+        text: Raw text string
+
+    Returns:
+        Cleaned text string
+    """
+    if not text or not isinstance(text, str):
+        return ""
+
+    cdef str cleaned = text
+    if _MARKUP_SCAN is None or _MARKUP_SCAN(cleaned):
+        cleaned = _URL_RE.sub('', cleaned)
+        cleaned = _WWW_RE.sub('', cleaned)
+        cleaned = _BOLD_RE.sub(r'\1', cleaned)
+        cleaned = _ITAL_RE.sub(r'\1', cleaned)
+        cleaned = _STRIKE_RE.sub(r'\1', cleaned)
+    cleaned = _MULTI_NL_RE.sub('\n', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
+    return cleaned.strip()
@@ -0,0 +1,35 @@
+"""
+Shared regex sources for clean_text().
+
+Imported by both clean_compile.py and the compiled _clean.pyx, so the
+pure-Python and Cython builds always clean text with the same patterns.
+"""
+
+# URLs are removed. A URL runs up to the next whitespace, so fragments and
+# any text glued to it are removed too ('a http://x.com/#frag b' -> 'a b').
+HTTP_URL_PATTERN = r'https?://{nonspace}+'
+WWW_URL_PATTERN = r'www\.{nonspace}+'
+
+# Markdown formatting keeps its text. Each pattern runs as its own pass, in
+# this order, so nested emphasis such as '***x***' or '*a **b***' unwraps
+# fully: bold first, then italic, then strikethrough.
+BOLD_PATTERN = r'\*\*([^*]+)\*\*'
+ITALIC_PATTERN = r'\*([^*]+)\*'
+STRIKE_PATTERN = r'~~([^~]+)~~'
+
+# Matches wherever any of the passes above would change the text; used as a
+# pre-scan so texts without URLs or markup skip those passes entirely
+MARKUP_PATTERN = '|'.join([
+    HTTP_URL_PATTERN, WWW_URL_PATTERN, BOLD_PATTERN, ITALIC_PATTERN, STRIKE_PATTERN
+])
+
+# Non-whitespace class for the URL patterns with the re module
+NONSPACE = r'\S'
+
+# RE2's \S is ASCII-only, so Python's Unicode whitespace is spelled out to
+# match exactly the same texts as the re version
+RE2_NONSPACE = r'[^\t\n\v\f\r\x1c-\x1f\x85\p{Z}]'
+
+# Multiple newlines to single, then multiple spaces/tabs to single
+MULTI_NEWLINE_PATTERN = r'\n\s*\n'
+SPACES_PATTERN = r'[ \t]+'
@@ -13,6 +13,12 @@ DESCRIPTION:
 REQUIREMENTS:
     - Python 3.7+
     - Standard library only (no external dependencies)
+    - Optional: orjson or ujson for faster JSON parsing/serialization
+    - Optional: ijson to parse input files one at a time (O(largest file) memory)
+    - Optional: xxhash for faster title fingerprinting during deduplication
+    - Optional: datasketch for near-duplicate title detection (FUZZY_DEDUP)
+    - Optional: Cython to build the compiled clean_text() in _clean.pyx
+    - Optional: google-re2 for a linear-time URL/markup pre-scan
 
 INPUT:
     - JSON files in ./output/ directory
@@ -26,13 +32,70 @@ AUTHOR: Your Name
 DATE: 2025-10-13
 """
 
-import json
 import re
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Set, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
+
+from _text_patterns import (
+    BOLD_PATTERN, HTTP_URL_PATTERN, ITALIC_PATTERN, MARKUP_PATTERN,
+    MULTI_NEWLINE_PATTERN, NONSPACE, RE2_NONSPACE, SPACES_PATTERN,
+    STRIKE_PATTERN, WWW_URL_PATTERN
+)
+
+# Use the fastest available JSON backend (orjson > ujson > stdlib json).
+# _json_loads accepts bytes; _json_dumps returns UTF-8 encoded bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson as json
+
+        # ujson escapes '/' as '\/' by default; match stdlib/orjson output
+        _JSON_DUMPS_OPTIONS = {'ensure_ascii': False, 'escape_forward_slashes': False}
+    except ImportError:
+        import json
+
+        _JSON_DUMPS_OPTIONS = {'ensure_ascii': False}
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, **_JSON_DUMPS_OPTIONS).encode('utf-8')
+
+# 64-bit title fingerprints for deduplication; the built-in str hash is
+# also 64 bits wide and stable within a single run
+try:
+    import xxhash
+
+    def _fingerprint(text: str) -> int:
+        return xxhash.xxh3_64_intdigest(text.encode('utf-8'))
+except ImportError:
+    _fingerprint = hash
+
+# MinHash LSH for near-duplicate title detection (FUZZY_DEDUP)
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+# Linear-time (DFA) regex engine for the URL/markup pre-scan in clean_text()
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Parse input files incrementally when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # ============================================================================
 # CONFIGURATION
@@ -44,12 +107,41 @@ INPUT_DIR = Path("output")
 # Output file path
 OUTPUT_FILE = Path("compiled_clean.jsonl")
 
+# Posts serialized per write() call when saving the JSONL output
+WRITE_CHUNK_SIZE = 10000
+
 # Minimum body length (characters) to keep a post
 MIN_BODY_LEN = 5
 
+# Maximum number of threads used to load JSON files (reads overlap, parsing does not)
+LOAD_WORKERS = 8
+
+# Minimum number of input files before readahead is requested for all of
+# them up front (Linux/POSIX only; not worth it for a couple of files)
+PREFETCH_MIN_FILES = 4
+
+# Number of worker processes used to clean posts (None = one per CPU core)
+CLEAN_WORKERS = None
+
+# Posts sent to a worker process per task (amortizes pickling overhead)
+CLEAN_CHUNKSIZE = 256
+
+# Posts buffered per round of parallel cleaning; inputs smaller than one
+# batch are cleaned in-process (pool start-up would dominate)
+CLEAN_BATCH_SIZE = 10000
+
 # Remove duplicate posts based on title similarity
 REMOVE_DUPLICATES = True
 
+# Also remove near-duplicate titles via MinHash LSH (requires datasketch)
+FUZZY_DEDUP = False
+
+# Jaccard similarity of title character 3-grams above which titles match
+FUZZY_THRESHOLD = 0.85
+
+# Number of MinHash permutations (higher is more accurate but slower)
+FUZZY_NUM_PERM = 64
+
 # Strings indicating deleted/removed content
 DELETED_MARKERS = {
     "[deleted]",
@@ -60,41 +152,184 @@ DELETED_MARKERS = {
     "**deleted**"
 }
 
+# Precompiled patterns used by clean_text() and normalize_title()
+# (clean_text() sources are shared with _clean.pyx, see _text_patterns.py)
+_URL_RE = re.compile(HTTP_URL_PATTERN.format(nonspace=NONSPACE))
+_WWW_RE = re.compile(WWW_URL_PATTERN.format(nonspace=NONSPACE))
+_BOLD_RE = re.compile(BOLD_PATTERN)
+_ITAL_RE = re.compile(ITALIC_PATTERN)
+_STRIKE_RE = re.compile(STRIKE_PATTERN)
+_MULTI_NL_RE = re.compile(MULTI_NEWLINE_PATTERN)
+_WS_RE = re.compile(SPACES_PATTERN)
+# With RE2 installed, a linear-time DFA search first checks whether a text
+# contains any URL/markup at all; most bodies contain none and skip the
+# URL and markdown passes.
+_MARKUP_SCAN = re2.compile(
+    MARKUP_PATTERN.format(nonspace=RE2_NONSPACE)
+).search if re2 is not None else None
+# Any deleted/removed marker, matched case-insensitively in one scan
+_DELETED_RE = re.compile(
+    '|'.join(re.escape(marker) for marker in DELETED_MARKERS), re.IGNORECASE
+)
+# First characters of all markers (in either case); bodies containing none
+# of them cannot contain a marker, so most posts skip the regex entirely
+_DELETED_LEADS = tuple(
+    {lead for marker in DELETED_MARKERS for lead in (marker[0].lower(), marker[0].upper())}
+)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SPACES_RE = re.compile(r'\s+')
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def load_json_files(directory: Path) -> List[Dict]:
+def _load_json_file(filepath: Path) -> Tuple[Optional[Dict], Optional[str]]:
     """
-    Load all JSON files from the specified directory.
+    Read and parse a single JSON file.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Tuple of (parsed JSON object or None, error message or None)
+    """
+    try:
+        return _json_loads(filepath.read_bytes()), None
+    except ValueError as e:
+        # JSONDecodeError of every backend subclasses ValueError
+        return None, f"Error parsing {filepath.name}: {e}"
+    except Exception as e:
+        return None, f"Error reading {filepath.name}: {e}"
+
+
+def find_json_files(directory: Path) -> List[Path]:
+    """
+    Find all JSON files in the specified directory.
     
     Args:
         directory: Path to directory containing JSON files
         
     Returns:
-        List of parsed JSON objects
+        List of JSON file paths
     """
-    json_data = []
     json_files = list(directory.glob("*.json"))
     
     if not json_files:
         print(f"⚠️  No JSON files found in {directory}")
-        return json_data
+        return json_files
     
     print(f"📂 Found {len(json_files)} JSON file(s) in {directory}")
+    return json_files
+
+
+def load_json_files(json_files: List[Path],
+                    loaded_files: Optional[List[Path]] = None) -> List[Dict]:
+    """
+    Load all given JSON files.
     
-    for filepath in json_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    Files are loaded on a thread pool. Only the file reads release the GIL
+    and overlap across threads; parsing holds the GIL, so parse time still
+    adds up across files.
+    
+    Args:
+        json_files: Paths of the JSON files to load
+        loaded_files: Optional list that successfully loaded paths are
+            appended to
+        
+    Returns:
+        List of parsed JSON objects
+    """
+    json_data = []
+    
+    if not json_files:
+        return json_data
+    
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(json_files))) as executor:
+        results = executor.map(_load_json_file, json_files)
+        
+        for filepath, (data, error) in zip(json_files, results):
+            if error:
+                print(f"   ✗ {error}")
+            else:
                 json_data.append(data)
+                if loaded_files is not None:
+                    loaded_files.append(filepath)
                 print(f"   ✓ Loaded: {filepath.name}")
-        except json.JSONDecodeError as e:
+    
+    return json_data
+
+
+def prefetch_files(json_files: List[Path]) -> None:
+    """
+    Ask the kernel to start reading all input files in the background.
+    
+    Readahead for every file is queued before any file is parsed, so
+    cold-cache disk reads overlap with parsing instead of happening one
+    file at a time. No-op on platforms without posix_fadvise.
+    
+    Args:
+        json_files: Paths of the JSON files that will be read
+    """
+    if not hasattr(os, 'posix_fadvise') or len(json_files) < PREFETCH_MIN_FILES:
+        return
+    
+    for filepath in json_files:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            continue  # Reported when the file is actually read
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def iter_posts(json_files: List[Path],
+               loaded_files: Optional[List[Path]] = None) -> Iterator[Dict]:
+    """
+    Yield the raw posts of all given JSON files.
+    
+    With ijson installed, files are read one at a time and only each file's
+    'posts' array is built, never its metadata. Each file's posts are
+    buffered in full before any is yielded, so that a file which fails to
+    parse contributes no posts; peak memory is therefore O(largest file),
+    not O(one post). Without ijson, all files are loaded whole with
+    load_json_files().
+    
+    Args:
+        json_files: Paths of the JSON files to read
+        loaded_files: Optional list that successfully loaded paths are
+            appended to
+        
+    Yields:
+        Raw post dictionaries
+    """
+    prefetch_files(json_files)
+    
+    if ijson is None:
+        for data in load_json_files(json_files, loaded_files):
+            yield from data.get('posts', [])
+        return
+    
+    for filepath in json_files:
+        try:
+            # Buffer the file's posts so a parse error part-way through
+            # drops the whole file instead of passing on a partial one
+            with open(filepath, 'rb') as f:
+                posts = list(ijson.items(f, 'posts.item'))
+        except ijson.JSONError as e:
             print(f"   ✗ Error parsing {filepath.name}: {e}")
+            continue
         except Exception as e:
             print(f"   ✗ Error reading {filepath.name}: {e}")
-    
-    return json_data
+            continue
+        
+        if loaded_files is not None:
+            loaded_files.append(filepath)
+        print(f"   ✓ Loaded: {filepath.name}")
+        yield from posts
 
 
 def clean_text(text: Optional[str]) -> str:
@@ -110,18 +345,19 @@ def clean_text(text: Optional[str]) -> str:
     if not text or not isinstance(text, str):
         return ""
     
-    # Remove URLs (http, https, www)
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-    text = re.sub(r'www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-    
-    # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-    text = re.sub(r'~~([^~]+)~~', r'\1', text)      # Strikethrough
+    if _MARKUP_SCAN is None or _MARKUP_SCAN(text):
+        # Remove URLs (http, https, www)
+        text = _URL_RE.sub('', text)
+        text = _WWW_RE.sub('', text)
+        
+        # Remove markdown formatting
+        text = _BOLD_RE.sub(r'\1', text)    # Bold
+        text = _ITAL_RE.sub(r'\1', text)    # Italic
+        text = _STRIKE_RE.sub(r'\1', text)  # Strikethrough
     
     # Remove excessive newlines and whitespace
-    text = re.sub(r'\n\s*\n', '\n', text)  # Multiple newlines to single
-    text = re.sub(r'[ \t]+', ' ', text)    # Multiple spaces to single
+    text = _MULTI_NL_RE.sub('\n', text)  # Multiple newlines to single
+    text = _WS_RE.sub(' ', text)         # Multiple spaces to single
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -129,33 +365,14 @@ def clean_text(text: Optional[str]) -> str:
     return text
 
 
-def is_valid_post(post: Dict, min_length: int = MIN_BODY_LEN) -> bool:
-    """
-    Check if a post meets validity criteria.
-    
-    Args:
-        post: Post dictionary
-        min_length: Minimum body length in characters
-        
-    Returns:
-        True if post is valid, False otherwise
-    """
-    body = post.get('body', '').strip()
-    title = post.get('title', '').strip()
-    
-    # Check for deleted/removed content
-    if any(marker in body.lower() for marker in DELETED_MARKERS):
-        return False
-    
-    # Check minimum length
-    if len(body) < min_length:
-        return False
-    
-    # Check for empty title
-    if not title:
-        return False
-    
-    return True
+# Prefer the compiled build of clean_text() when available (see _clean.pyx);
+# tests/clean-text-check.py checks that it matches the pure-Python version
+_clean_text_python = clean_text
+
+try:
+    from _clean import clean_text
+except ImportError:
+    pass
 
 
 def normalize_title(title: str) -> str:
@@ -172,8 +389,8 @@ def normalize_title(title: str) -> str:
     normalized = title.lower()
     
     # Remove punctuation and extra spaces
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _PUNCT_RE.sub('', normalized)
+    normalized = _SPACES_RE.sub(' ', normalized)
     
     return normalized.strip()
 
@@ -192,45 +409,118 @@ def process_post(post: Dict) -> Optional[Dict]:
     Returns:
         Cleaned post dictionary or None if invalid
     """
-    # Clean title and body
-    cleaned_post = {
+    # Clean and check the title first; an empty title skips body cleaning
+    title = clean_text(post.get('title', ''))
+    if not title:
+        return None
+    
+    # clean_text() already strips, so the body is checked as-is
+    body = clean_text(post.get('body', ''))
+    
+    # Check minimum length
+    if len(body) < MIN_BODY_LEN:
+        return None
+    
+    # Check for deleted/removed content (cheap pre-filter before the regex)
+    if any(lead in body for lead in _DELETED_LEADS) and _DELETED_RE.search(body):
+        return None
+    
+    return {
         'subreddit': post.get('subreddit', 'unknown'),
-        'title': clean_text(post.get('title', '')),
-        'body': clean_text(post.get('body', ''))
+        'title': title,
+        'body': body
     }
+
+
+def clean_posts(posts: Iterable[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Process all posts, in parallel across worker processes for large inputs.
     
-    # Validate post (need to add temp fields for validation)
-    temp_post = cleaned_post.copy()
+    Posts are consumed in batches of CLEAN_BATCH_SIZE, so a streaming
+    input is never materialized in full.
     
-    # Validate post
-    if not is_valid_post(temp_post):
-        return None
+    Args:
+        posts: Iterable of raw post dictionaries
+        
+    Returns:
+        Tuple of (cleaned, valid posts in their original order,
+        number of raw posts read)
+    """
+    posts = iter(posts)
+    batch = list(islice(posts, CLEAN_BATCH_SIZE))
+    cleaned_posts = []
+    total = 0
+    
+    # Inputs that fit in a single batch are cleaned without starting a pool
+    if CLEAN_WORKERS == 1 or len(batch) < CLEAN_BATCH_SIZE:
+        for total, post in enumerate(chain(batch, posts), start=1):
+            cleaned = process_post(post)
+            if cleaned is not None:
+                cleaned_posts.append(cleaned)
+        return cleaned_posts, total
+    
+    with ProcessPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+        while batch:
+            total += len(batch)
+            results = executor.map(process_post, batch, chunksize=CLEAN_CHUNKSIZE)
+            cleaned_posts.extend(post for post in results if post is not None)
+            batch = list(islice(posts, CLEAN_BATCH_SIZE))
+    
+    return cleaned_posts, total
+
+
+def _title_minhash(normalized: str) -> "MinHash":
+    """
+    Build a MinHash signature from the character 3-grams of a title.
     
-    return cleaned_post
+    Args:
+        normalized: Normalized post title
+        
+    Returns:
+        MinHash signature of the title
+    """
+    shingles = {normalized[i:i + 3] for i in range(max(1, len(normalized) - 2))}
+    minhash = MinHash(num_perm=FUZZY_NUM_PERM)
+    minhash.update_batch([shingle.encode('utf-8') for shingle in shingles])
+    return minhash
 
 
-def deduplicate_posts(posts: List[Dict]) -> Tuple[List[Dict], int]:
+def deduplicate_posts(posts: List[Dict], fuzzy: bool = False) -> Tuple[List[Dict], int]:
     """
     Remove duplicate posts based on normalized title.
     
     Args:
         posts: List of post dictionaries
+        fuzzy: Also remove near-duplicate titles via MinHash LSH
+            (requires datasketch)
         
     Returns:
         Tuple of (deduplicated posts list, number of duplicates removed)
     """
-    seen_titles: Set[str] = set()
+    # Store 64-bit fingerprints instead of the titles themselves; collisions
+    # are negligible at any realistic dataset size
+    seen_titles: Set[int] = set()
     unique_posts = []
     duplicates = 0
+    lsh = MinHashLSH(threshold=FUZZY_THRESHOLD, num_perm=FUZZY_NUM_PERM) if fuzzy else None
     
     for post in posts:
         normalized = normalize_title(post['title'])
+        fingerprint = _fingerprint(normalized)
         
-        if normalized not in seen_titles:
-            seen_titles.add(normalized)
-            unique_posts.append(post)
-        else:
+        if fingerprint in seen_titles:
             duplicates += 1
+            continue
+        
+        if lsh is not None:
+            minhash = _title_minhash(normalized)
+            if lsh.query(minhash):
+                duplicates += 1
+                continue
+            lsh.insert(len(unique_posts), minhash)
+        
+        seen_titles.add(fingerprint)
+        unique_posts.append(post)
     
     return unique_posts, duplicates
 
@@ -248,27 +538,36 @@ def calculate_stats(posts: List[Dict]) -> Dict:
     if not posts:
         return {}
     
-    # Overall stats
-    total_posts = len(posts)
-    total_body_length = sum(len(p['body']) for p in posts)
-    avg_body_length = total_body_length / total_posts if total_posts > 0 else 0
-    
-    # Per-subreddit stats
-    subreddit_stats = defaultdict(lambda: {'count': 0, 'total_length': 0})
+    # Overall and per-subreddit totals in a single pass; per-subreddit
+    # counts and body lengths live in parallel lists indexed by sub_ids
+    total_body_length = 0
+    sub_ids: Dict[str, int] = {}
+    counts: List[int] = []
+    totals: List[int] = []
     
     for post in posts:
-        sub = post['subreddit']
-        subreddit_stats[sub]['count'] += 1
-        subreddit_stats[sub]['total_length'] += len(post['body'])
+        body_length = len(post['body'])
+        total_body_length += body_length
+        i = sub_ids.setdefault(post['subreddit'], len(sub_ids))
+        if i == len(counts):
+            counts.append(0)
+            totals.append(0)
+        counts[i] += 1
+        totals[i] += body_length
     
-    # Calculate averages
-    for sub, stats in subreddit_stats.items():
-        stats['avg_length'] = stats['total_length'] / stats['count']
+    total_posts = len(posts)
     
     return {
         'total_posts': total_posts,
-        'avg_body_length': avg_body_length,
-        'subreddit_stats': dict(subreddit_stats)
+        'avg_body_length': total_body_length / total_posts,
+        'subreddit_stats': {
+            sub: {
+                'count': counts[i],
+                'total_length': totals[i],
+                'avg_length': totals[i] / counts[i]
+            }
+            for sub, i in sub_ids.items()
+        }
     }
 
 
@@ -289,40 +588,27 @@ def main():
         print(f"   Please create the directory and add JSON files.")
         return
     
-    # Load JSON files
-    print("📥 LOADING DATA")
+    # Find JSON files; posts are cleaned and filtered as each file loads,
+    # so loading and cleaning share one section
+    print("📥 LOADING & CLEANING DATA")
     print("-" * 70)
-    json_data = load_json_files(INPUT_DIR)
+    json_files = find_json_files(INPUT_DIR)
     
-    if not json_data:
+    if not json_files:
         print("❌ No data loaded. Exiting.")
         return
     
-    # Extract all posts
-    print()
-    print("🔍 EXTRACTING POSTS")
-    print("-" * 70)
-    all_posts = []
-    for data in json_data:
-        posts = data.get('posts', [])
-        all_posts.extend(posts)
+    # Stream, clean and filter posts
+    loaded_files: List[Path] = []
+    cleaned_posts, total_posts = clean_posts(iter_posts(json_files, loaded_files))
+    skipped = total_posts - len(cleaned_posts)
     
-    print(f"   Total posts extracted: {len(all_posts)}")
+    if not loaded_files:
+        print("❌ No data loaded. Exiting.")
+        return
     
-    # Clean and filter posts
     print()
-    print("🧹 CLEANING & FILTERING")
-    print("-" * 70)
-    cleaned_posts = []
-    skipped = 0
-    
-    for post in all_posts:
-        cleaned = process_post(post)
-        if cleaned:
-            cleaned_posts.append(cleaned)
-        else:
-            skipped += 1
-    
+    print(f"   Total posts extracted: {total_posts}")
     print(f"   ✓ Cleaned posts: {len(cleaned_posts)}")
     print(f"   ✗ Skipped posts: {skipped}")
     
@@ -331,7 +617,10 @@ def main():
         print()
         print("🔄 DEDUPLICATING")
         print("-" * 70)
-        cleaned_posts, duplicates = deduplicate_posts(cleaned_posts)
+        fuzzy = FUZZY_DEDUP and MinHashLSH is not None
+        if FUZZY_DEDUP and not fuzzy:
+            print("   ⚠️  datasketch not installed, using exact title matching only")
+        cleaned_posts, duplicates = deduplicate_posts(cleaned_posts, fuzzy=fuzzy)
         print(f"   ✓ Unique posts: {len(cleaned_posts)}")
         print(f"   ✗ Duplicates removed: {duplicates}")
     
@@ -357,10 +646,13 @@ def main():
     print("💾 SAVING OUTPUT")
     print("-" * 70)
     try:
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            for post in cleaned_posts:
-                json_line = json.dumps(post, ensure_ascii=False)
-                f.write(json_line + '\n')
+        with open(OUTPUT_FILE, 'wb') as f:
+            # One write per chunk of lines instead of one per post; map()
+            # keeps the per-post serialization loop out of Python bytecode
+            for start in range(0, len(cleaned_posts), WRITE_CHUNK_SIZE):
+                chunk = cleaned_posts[start:start + WRITE_CHUNK_SIZE]
+                f.write(b'\n'.join(map(_json_dumps, chunk)))
+                f.write(b'\n')
         
         print(f"   ✓ Saved to: {OUTPUT_FILE}")
         print(f"   ✓ File size: {OUTPUT_FILE.stat().st_size / 1024:.1f} KB")
@@ -373,8 +665,8 @@ def main():
     print("=" * 70)
     print("✅ PROCESSING COMPLETE")
     print("=" * 70)
-    print(f"   Input files: {len(json_data)}")
-    print(f"   Total posts processed: {len(all_posts)}")
+    print(f"   Input files: {len(loaded_files)}")
+    print(f"   Total posts processed: {total_posts}")
     print(f"   Final clean dataset: {len(cleaned_posts)} posts")
     print(f"   Output: {OUTPUT_FILE}")
     print()
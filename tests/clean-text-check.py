@@ -0,0 +1,48 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import clean_compile
+from clean_compile import clean_text
+
+# (raw text, expected cleaned text)
+CASES = [
+    ("***bold italic***", "bold italic"),
+    ("I am ***very*** sad", "I am very sad"),
+    ("*Update: **fixed***", "Update: fixed"),
+    ("I was ***so** tired* today", "I was so tired today"),
+    ("**bold** *italic* ~~struck~~", "bold italic struck"),
+    ("see **https://example.com** here", "see ** here"),
+    ("visit www.example.com today", "visit today"),
+    ("line one\n\n\nline   two", "line one\nline two"),
+]
+
+# Test: clean_text() output for common Reddit markdown
+for raw, expected in CASES:
+    result = clean_text(raw)
+    assert result == expected, f"clean_text({raw!r}) = {result!r}, expected {expected!r}"
+
+print(f"All {len(CASES)} clean_text checks passed")
+
+# Test: compiled _clean build (if built) matches the pure-Python version
+try:
+    from _clean import clean_text as compiled
+except ImportError:
+    compiled = None
+
+python = clean_compile._clean_text_python
+if compiled is None:
+    print("Compiled _clean extension not built, skipping build comparison")
+else:
+    tokens = ["word", " ", "  ", "\t", "\n", "\n\n", "*", "**", "***", "~~",
+              "https://example.com/a#b", "www.example.com", "\xa0", "ü"]
+    rng = random.Random(0)
+    for _ in range(20000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 16)))
+        assert compiled(text) == python(text), (
+            f"builds disagree on {text!r}; the compiled _clean extension is "
+            f"out of date, rebuild it with: cythonize -i scripts/_clean.pyx"
+        )
+    print("Compiled and pure-Python clean_text builds agree")